@@ -5,7 +5,7 @@ Class for budget representation.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Budget:
     """Budget for one day.
     """
@@ -2,12 +2,81 @@
 """
 
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from queue import Empty, LifoQueue
+from typing import Iterator
+import os
+import sqlite3
+
 from bookkeeper.repository.abstract_repository import AbstractRepository
 from bookkeeper.repository.sqlite_repository import SQLiteRepository
 from bookkeeper.models.budget import Budget
 from bookkeeper.models.category import Category
 from bookkeeper.models.expense import Expense
 
+_DB_PATH = os.environ.get("BOOKKEEPER_DB", "databases/ui_client.db")
+
+# applied once to every new pooled connection
+_PRAGMAS = '''
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -20000;
+PRAGMA mmap_size = 268435456;
+'''
+
+
+class _ConnectionPool:
+    """Pool of opened connections to one DB file.
+
+    Connections are opened lazily and returned to the pool after use,
+    so repositories do not reopen DB file on every operation.
+    """
+    _instances: dict[str, '_ConnectionPool'] = {}
+
+    def __init__(self, db_file: str) -> None:
+        self.db_file = db_file
+        self._queue: LifoQueue[sqlite3.Connection] = LifoQueue()
+
+    @classmethod
+    def get_instance(cls, db_file: str) -> '_ConnectionPool':
+        """Returns process-wide pool for db_file.
+        """
+        if db_file not in cls._instances:
+            cls._instances[db_file] = cls(db_file)
+        return cls._instances[db_file]
+
+    def _open(self) -> sqlite3.Connection:
+        con = sqlite3.connect(
+            self.db_file,
+            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES,
+            check_same_thread=False,
+            isolation_level=None)
+        con.executescript(_PRAGMAS)
+        return con
+
+    @contextmanager
+    def acquire(self) -> Iterator[sqlite3.Connection]:
+        """Takes connection from the pool and puts it back on exit.
+
+        Yields:
+            sqlite3.Connection: connection to DB.
+        """
+        try:
+            con = self._queue.get_nowait()
+        except Empty:
+            con = self._open()
+        try:
+            with con:
+                yield con
+        finally:
+            self.release(con)
+
+    def release(self, con: sqlite3.Connection) -> None:
+        """Returns connection to the pool.
+        """
+        self._queue.put(con)
+
 
 class AbsRepoFactory(ABC):
     """Represents abstract repository factory.
@@ -19,29 +88,47 @@ class AbsRepoFactory(ABC):
 
     @abstractmethod
     def get_bgt(self) -> AbstractRepository[Budget]:
-        """Returns AbstractRepository for Category
+        """Returns AbstractRepository for Budget
         """
 
     @abstractmethod
     def get_exp(self) -> AbstractRepository[Expense]:
-        """Returns AbstractRepository for Category
+        """Returns AbstractRepository for Expense
         """
 
 
 class RepositoryFactory(AbsRepoFactory):
     """Represents SQLiteRepository repository factory.
+    Repositories are created once and reused on later calls.
     """
+    def __init__(self) -> None:
+        self._ctg: SQLiteRepository[Category] | None = None
+        self._bgt: SQLiteRepository[Budget] | None = None
+        self._exp: SQLiteRepository[Expense] | None = None
+
     def get_ctg(self) -> AbstractRepository[Category]:
         """Returns SQLiteRepository for Category
         """
-        return SQLiteRepository[Category]("databases/ui_client.db", Category)
+        if self._ctg is None:
+            self._ctg = SQLiteRepository[Category](
+                _DB_PATH, Category,
+                _ConnectionPool.get_instance(_DB_PATH).acquire)
+        return self._ctg
 
     def get_bgt(self) -> AbstractRepository[Budget]:
-        """Returns SQLiteRepository for Category
+        """Returns SQLiteRepository for Budget
         """
-        return SQLiteRepository[Budget]("databases/ui_client.db", Budget)
+        if self._bgt is None:
+            self._bgt = SQLiteRepository[Budget](
+                _DB_PATH, Budget,
+                _ConnectionPool.get_instance(_DB_PATH).acquire)
+        return self._bgt
 
     def get_exp(self) -> AbstractRepository[Expense]:
-        """Returns SQLiteRepository for Category
+        """Returns SQLiteRepository for Expense
         """
-        return SQLiteRepository[Expense]("databases/ui_client.db", Expense)
+        if self._exp is None:
+            self._exp = SQLiteRepository[Expense](
+                _DB_PATH, Expense,
+                _ConnectionPool.get_instance(_DB_PATH).acquire)
+        return self._exp
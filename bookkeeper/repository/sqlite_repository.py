@@ -2,7 +2,10 @@
 Модуль описывает репозиторий, работающий с sqlite
 """
 
-from typing import Any
+from typing import Any, Callable, ContextManager, Iterator, Mapping
+from types import MappingProxyType
+from contextlib import contextmanager
+from functools import lru_cache
 from datetime import datetime
 from inspect import get_annotations
 import sqlite3
@@ -29,25 +32,93 @@ def adddecor(value: str | int) -> str | int:
     return value
 
 
+@lru_cache(maxsize=None)
+def _fields_for(cls: type) -> tuple[str, ...]:
+    """Returns names of annotated model fields except pk, once per class.
+    """
+    fields = get_annotations(cls, eval_str=True)
+    fields.pop('pk')
+    return tuple(fields)
+
+
+@lru_cache(maxsize=None)
+def _sql_for(cls: type) -> Mapping[str, str]:
+    """Builds SQL queries for model class once per class.
+    Result is shared by repositories of the class, so it is read-only.
+
+    Returns:
+        Mapping[str, str]: queries by names 'create', 'insert', 'select',
+        'select_all', 'exists', 'update', 'delete', 'delete_all'.
+    """
+    table_name = cls.__name__.lower()
+    fields = _fields_for(cls)
+
+    # defaults are taken from instance: slotted classes keep descriptors in class
+    defaults = cls()
+    columns = ', '.join(f'{x} {gettype(getattr(defaults, x))}' for x in fields)
+    names = ', '.join(fields)
+    qmarks = ', '.join('?' * len(fields))
+    setter = ', '.join(f'{x} = ?' for x in fields)
+    return MappingProxyType({
+        'create': (f'CREATE TABLE IF NOT EXISTS {table_name} '
+                   f'(id INTEGER PRIMARY KEY, {columns})'),
+        'insert': f'INSERT INTO {table_name} ({names}) VALUES ({qmarks})',
+        'select': f'SELECT * FROM {table_name} WHERE id = ?',
+        'select_all': f'SELECT * FROM {table_name}',
+        'exists': f'SELECT 1 FROM {table_name} WHERE id = ?',
+        'update': f'UPDATE {table_name} SET {setter} WHERE id = ?',
+        'delete': f'DELETE FROM {table_name} WHERE id = ?',
+        'delete_all': f'DELETE FROM {table_name}',
+    })
+
+
+ConnectionProvider = Callable[[], ContextManager[sqlite3.Connection]]
+
+
 class SQLiteRepository(AbstractRepository[T]):
     """SQL db repository.
+
+    Model class must be constructible without arguments: column types
+    are taken from default values of a default instance, and objects
+    are created this way when read from DB.
+
+    If con_provider is given, connections are taken from it
+    (e.g. from a connection pool), otherwise a new connection
+    to db_file is opened for every operation.
     """
 
-    def __init__(self, db_file: str, cls: type) -> None:
+    def __init__(self, db_file: str, cls: type,
+                 con_provider: ConnectionProvider | None = None) -> None:
         self.db_file = db_file
+        self.con_provider = con_provider
         self.table_name = cls.__name__.lower()
-        self.fields = get_annotations(cls, eval_str=True)
-        self.fields.pop('pk')
+        self.fields = _fields_for(cls)
         self.cls_ty = cls
+        self.sql = _sql_for(cls)
 
-        with sqlite3.connect(self.db_file) as con:
-            values = [(f'{x}', gettype(getattr(cls, x))) for x in self.fields]
-            qstring = ', '.join([f'{x} {ty}' for x, ty in values])
-            cur = con.cursor()
-            query = (f'CREATE TABLE IF NOT EXISTS {self.table_name} '
-                     f'(id INTEGER PRIMARY KEY, {qstring})')
-            cur.execute(query)
-        con.close()
+        with self.connect() as con:
+            con.execute(self.sql['create'])
+
+    @contextmanager
+    def connect(self) -> Iterator[sqlite3.Connection]:
+        """Provides connection to DB, commits changes on exit.
+
+        Yields:
+            sqlite3.Connection: connection to DB.
+        """
+        if self.con_provider is not None:
+            with self.con_provider() as con:
+                yield con
+            return
+
+        con = sqlite3.connect(
+            self.db_file,
+            detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES)
+        try:
+            with con:
+                yield con
+        finally:
+            con.close()
 
     def is_pk_in_db(self, cur: Any, pk: int) -> bool:
         """Forms query to DB to check is records with pk exists.
@@ -59,8 +130,7 @@ class SQLiteRepository(AbstractRepository[T]):
         Returns:
             bool: True if record exists, overwise False
         """
-        query = f'SELECT * FROM {self.table_name} WHERE id = {pk}'
-        res = cur.execute(query).fetchone()
+        res = cur.execute(self.sql['exists'], (pk,)).fetchone()
         return res is not None
 
     def add(self, obj: T) -> int:
@@ -78,22 +148,47 @@ class SQLiteRepository(AbstractRepository[T]):
         """
         if getattr(obj, 'pk', None) != 0:
             raise ValueError(f'trying to add object {obj} with filled `pk` attribute')
-        names = ', '.join(self.fields.keys())
-        qmarks = ', '.join("?" * len(self.fields))
         values = [getattr(obj, x) for x in self.fields]
-        with sqlite3.connect(self.db_file) as con:
+        with self.connect() as con:
             cur = con.cursor()
             cur.execute('PRAGMA foreign_keys = ON')
-            cur.execute(
-                f'INSERT INTO {self.table_name} ({names}) VALUES ({qmarks})',
-                values
-            )
+            cur.execute(self.sql['insert'], values)
             assert isinstance(cur.lastrowid, int)
             obj.pk = cur.lastrowid
 
-        con.close()
         return obj.pk
 
+    def add_many(self, objs: list[T]) -> list[int]:
+        """Creates records about new objects in DB in one transaction.
+
+        Args:
+            objs (list[T]): Objects to create records about.
+
+        Raises:
+            ValueError: Trying to add object with filled pk.
+
+        Returns:
+            list[int]: private keys of inserted records.
+        """
+        for obj in objs:
+            if getattr(obj, 'pk', None) != 0:
+                raise ValueError(f'trying to add object {obj} with filled `pk` attribute')
+        query = self.sql['insert']
+        pks = []
+        with self.connect() as con:
+            cur = con.cursor()
+            cur.execute('PRAGMA foreign_keys = ON')
+            cur.execute('BEGIN')
+            for obj in objs:
+                cur.execute(query, [getattr(obj, x) for x in self.fields])
+                assert isinstance(cur.lastrowid, int)
+                pks.append(cur.lastrowid)
+
+        # pks are set only after commit, failed batch leaves objects untouched
+        for obj, pk in zip(objs, pks):
+            obj.pk = pk
+        return pks
+
     def fill_object(self, result: Any) -> T:
         """Fills attributes of object in accordance with results
 
@@ -111,15 +206,11 @@ class SQLiteRepository(AbstractRepository[T]):
 
     def get(self, pk: int) -> T | None:
         """ Получить объект по id """
-        with sqlite3.connect(
-                self.db_file,
-                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES) as con:
-            query = f'SELECT * FROM {self.table_name} WHERE id = {pk}'
-            result = con.cursor().execute(query).fetchone()
+        with self.connect() as con:
+            result = con.execute(self.sql['select'], (pk,)).fetchone()
             if result is None:
                 return None
             obj: T = self.fill_object(result)
-        con.close()
         return obj
 
     def get_all(self, where: dict[str, Any] | None = None) -> list[T]:
@@ -128,7 +219,7 @@ class SQLiteRepository(AbstractRepository[T]):
         where - условие в виде словаря {'название_поля': значение}
         если условие не задано (по умолчанию пусто), вернуть все записи
         """
-        query = f'SELECT * FROM {self.table_name}'
+        query = self.sql['select_all']
 
         condition = ''
         if where is not None:
@@ -137,42 +228,30 @@ class SQLiteRepository(AbstractRepository[T]):
                 condition += f' {key} = {adddecor(val)} AND'
             query += condition.rsplit(' ', 1)[0]
 
-        with sqlite3.connect(
-                self.db_file,
-                detect_types=sqlite3.PARSE_DECLTYPES | sqlite3.PARSE_COLNAMES) as con:
+        with self.connect() as con:
             results = con.cursor().execute(query).fetchall()
             objs = [self.fill_object(result) for result in results]
 
-        con.close()
         return objs
 
     def update(self, obj: T) -> None:
         """ Обновить данные об объекте. Объект должен содержать поле pk. """
         values = [getattr(obj, x) for x in self.fields]
-        setter = [f'{col} = ?' for col in self.fields]
-        upd_stm = ', '.join(setter)
-
-        value_tuple = tuple(values)
-        with sqlite3.connect(self.db_file) as con:
+        values.append(obj.pk)
+        with self.connect() as con:
             if not self.is_pk_in_db(con.cursor(), obj.pk):
                 raise ValueError(f'No object with id={obj.pk} in DB.')
-            query = f'UPDATE {self.table_name} SET {upd_stm} WHERE id = {obj.pk}'
-            con.cursor().execute(query, value_tuple)
-        con.close()
+            con.execute(self.sql['update'], values)
 
     def delete(self, pk: int) -> None:
         """ Удалить запись """
-        with sqlite3.connect(self.db_file) as con:
+        with self.connect() as con:
             if not self.is_pk_in_db(con.cursor(), pk):
                 raise KeyError(f'No object with id={pk} in DB.')
-            query = f'DELETE FROM {self.table_name} WHERE id = {pk}'
-            con.cursor().execute(query)
-        con.close()
+            con.execute(self.sql['delete'], (pk,))
 
     def delete_all(self) -> None:
         """Deletes all records in DB.
         """
-        with sqlite3.connect(self.db_file) as con:
-            query = f'DELETE FROM {self.table_name}'
-            con.cursor().execute(query)
-        con.close()
+        with self.connect() as con:
+            con.execute(self.sql['delete_all'])
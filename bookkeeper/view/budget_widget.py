@@ -3,119 +3,138 @@ Widget of budget table
 """
 
 from typing import Any, Callable
-from abc import ABC, abstractmethod
 
 from PySide6 import QtWidgets, QtCore
-from PySide6.QtWidgets import (QWidget, QTableWidgetItem, QMessageBox)
+from PySide6.QtWidgets import QWidget
 from bookkeeper.view.presenters import BudgetPresenter
 from bookkeeper.repository.repository_factory import RepositoryFactory
 from bookkeeper.models.budget import Budget
 
+_DISPLAY_ROLE = QtCore.Qt.ItemDataRole.DisplayRole
+_EDIT_ROLE = QtCore.Qt.ItemDataRole.EditRole
+_Index = QtCore.QModelIndex | QtCore.QPersistentModelIndex
 
-class AbstractItem(ABC):
-    """Class represents abstract widget item.
-    """
-    @abstractmethod
-    def get_value(self) -> None | float:
-        """Returns converted value or None, if convertion is impossible.
-        """
+_HHEADERS = ("Сумма", "Бюджет")
+_VHEADERS = ("День", "Неделя", "Месяц")
 
-    @abstractmethod
-    def update(self, bgt: Budget) -> None:
-        """Sets new budget.
-        """
 
-    @abstractmethod
-    def get(self) -> Budget:
-        """Returns budget.
-        """
+def _fmt2(value: float) -> str:
+    """Returns value as text with two decimal places.
+    """
+    # adding 0.0 turns -0.0 into 0.0, so zero is never shown as '-0.00'
+    return format(value + 0.0, '.2f')
 
 
-class LimitDayItem(QTableWidgetItem):
-    """Class represents Item with Day settings.
+class BudgetTableModel(QtCore.QAbstractTableModel):
+    """Class represents table model with expenses and budget
+    for day, week and month. Budget is stored for one day,
+    values for other rows are computed with multipliers.
+    Until data is set, cells are empty and budget is not editable.
     """
-    __metaclass__ = AbstractItem
+    MULTIPLIERS = (1, 7, 30)
 
-    def __init__(self, bgt: Budget):
+    def __init__(self, bgt_modifier: Callable[[Budget], None]) -> None:
         super().__init__()
-        self.update(bgt)
+        self.bgt_modifier = bgt_modifier
+        self.exp_texts: tuple[str, ...] = ()
+        self.exp_text_len = 0
+        self.bgt: Budget | None = None
+        self.bgt_texts: tuple[str, ...] = ()
 
-    def get_value(self) -> None | float:
-        """Returns converted value or None, if convertion is impossible.
+    @classmethod
+    def _budget_texts(cls, bgt: Budget) -> tuple[str, ...]:
+        """Returns texts of budget for day, week and month.
         """
-        try:
-            return float(self.text())
-        except ValueError:
-            return None
+        return tuple(_fmt2(bgt.amount * mul) for mul in cls.MULTIPLIERS)
 
-    def update(self, bgt: Budget) -> None:
-        """Sets new budget.
+    def rowCount(self,  # pylint: disable=invalid-name
+                 parent: _Index = QtCore.QModelIndex()) -> int:
+        """Returns number of rows.
         """
-        self.bgt = bgt
-        self.setText(str(round(self.bgt.amount, 2)))
+        return 0 if parent.isValid() else len(self.MULTIPLIERS)
 
-    def get(self) -> Budget:
-        """Returns budget.
+    def columnCount(self,  # pylint: disable=invalid-name
+                    parent: _Index = QtCore.QModelIndex()) -> int:
+        """Returns number of columns.
         """
-        return self.bgt
+        return 0 if parent.isValid() else len(_HHEADERS)
 
-
-class LimitWeekItem(QTableWidgetItem):
-    """Class represents Item with Week settings.
-    """
-    __metaclass__ = AbstractItem
-
-    def __init__(self, bgt: Budget):
-        super().__init__()
-        self.update(bgt)
-
-    def get_value(self) -> None | float:
-        """Returns converted value or None, if convertion is impossible.
+    def data(self, index: _Index,
+             role: int = _DISPLAY_ROLE) -> Any:
+        """Returns text of expense or budget cell for display
+        and number of budget cell for editing.
         """
-        try:
-            return float(self.text()) / 7
-        except ValueError:
+        if not index.isValid():
             return None
+        row = index.row()
+        if role == _DISPLAY_ROLE:
+            texts = self.exp_texts if index.column() == 0 else self.bgt_texts
+            return texts[row] if row < len(texts) else None
+        if role == _EDIT_ROLE and index.column() == 1 and self.bgt is not None:
+            # always float, so the default delegate opens QDoubleSpinBox
+            return round(float(self.bgt.amount) * self.MULTIPLIERS[row], 2)
+        return None
+
+    def headerData(self, section: int,  # pylint: disable=invalid-name
+                   orientation: QtCore.Qt.Orientation,
+                   role: int = _DISPLAY_ROLE) -> Any:
+        """Returns header labels.
+        """
+        if role != _DISPLAY_ROLE:
+            return None
+        if orientation == QtCore.Qt.Horizontal:  # type: ignore[attr-defined]
+            return _HHEADERS[section]
+        return _VHEADERS[section]
 
-    def update(self, bgt: Budget) -> None:
-        """Sets new budget.
-        """
-        self.bgt = bgt
-        self.setText(str(round(self.bgt.amount * 7, 2)))
-
-    def get(self) -> Budget:
-        """Returns budget.
+    def flags(self, index: _Index) -> QtCore.Qt.ItemFlag:
+        """Only budget column is editable after budget is set.
         """
-        return self.bgt
-
-
-class LimitMonthItem(QTableWidgetItem):
-    """Class represents Item with Month settings.
-    """
-    __metaclass__ = AbstractItem
+        flags = super().flags(index)
+        if index.column() == 1 and self.bgt is not None:
+            flags |= QtCore.Qt.ItemIsEditable  # type: ignore[attr-defined]
+        return flags
 
-    def __init__(self, bgt: Budget):
-        super().__init__()
-        self.update(bgt)
+    def setData(self, index: _Index,  # pylint: disable=invalid-name
+                value: Any,
+                role: int = _EDIT_ROLE) -> bool:
+        """Sets budget from edited cell. Editor produces numbers only,
+        so non-numeric values are just rejected.
 
-    def get_value(self) -> None | float:
-        """Returns converted value or None, if convertion is impossible.
+        Returns:
+            bool: True if value is accepted, otherwise - False.
         """
+        if role != _EDIT_ROLE or index.column() != 1 or self.bgt is None:
+            return False
         try:
-            return float(self.text()) / 30
-        except ValueError:
-            return None
-
-    def update(self, bgt: Budget) -> None:
-        """Sets new budget.
+            amount = float(value) / self.MULTIPLIERS[index.row()]
+        except (TypeError, ValueError):
+            return False
+        self.bgt.amount = amount
+        self.bgt_modifier(self.bgt)
+        self.set_budget(self.bgt)
+        return True
+
+    def set_expenses(self, exps: list[float]) -> bool:
+        """Sets expenses and refreshes expenses column.
+
+        Returns:
+            bool: True if length of the longest text is changed.
+        """
+        self.exp_texts = tuple(map(_fmt2, exps))
+        self.dataChanged.emit(self.index(0, 0),
+                              self.index(len(self.MULTIPLIERS) - 1, 0))
+        text_len = max(map(len, self.exp_texts), default=0)
+        changed = text_len != self.exp_text_len
+        self.exp_text_len = text_len
+        return changed
+
+    def set_budget(self, bgt: Budget) -> None:
+        """Sets budget and refreshes budget column.
         """
         self.bgt = bgt
-        self.setText(str(round(self.bgt.amount * 30, 2)))
-
-    def get(self) -> Budget:
-        """Returns budget.
-        """
-        return self.bgt
+        self.bgt_texts = self._budget_texts(bgt)
+        self.dataChanged.emit(self.index(0, 1),
+                              self.index(len(self.MULTIPLIERS) - 1, 1))
 
 
 class BudgetWidget(QWidget):
@@ -133,44 +152,28 @@ class BudgetWidget(QWidget):
         message = QtWidgets.QLabel("Бюджет")
         layout.addWidget(message)
 
-        self.expenses_table = QtWidgets.QTableWidget(2, 3)
-        self.expenses_table.setColumnCount(2)
-        self.expenses_table.setRowCount(3)
-        self.expenses_table.setHorizontalHeaderLabels("Сумма "
-                                                      "Бюджет ".split())
-        self.expenses_table.setVerticalHeaderLabels("День "
-                                                    "Неделя "
-                                                    "Месяц ".split())
+        self.model = BudgetTableModel(self.edit_bgt_event)
+        self.expenses_table = QtWidgets.QTableView()
+        self.expenses_table.setModel(self.model)
 
-        resize = QtWidgets.QHeaderView.ResizeToContents  # type: ignore[attr-defined]
+        interactive = QtWidgets.QHeaderView.Interactive  # type: ignore[attr-defined]
         stretch = QtWidgets.QHeaderView.Stretch  # type: ignore[attr-defined]
         header = self.expenses_table.horizontalHeader()
-        header.setSectionResizeMode(0, resize)
+        header.setSectionResizeMode(0, interactive)
         header.setSectionResizeMode(1, stretch)
 
-        for i in range(3):
-            lost_item = QtWidgets.QTableWidgetItem()
-            lost_item.setFlags(lost_item.flags() &
-                               ~QtCore.Qt.ItemIsEditable)  # type: ignore[attr-defined]
-            self.expenses_table.setItem(i, 0, lost_item)
-
-        bgt: Budget = Budget(1)
-        self.expenses_table.setItem(0, 1, LimitDayItem(bgt))
-        self.expenses_table.setItem(1, 1, LimitWeekItem(bgt))
-        self.expenses_table.setItem(2, 1, LimitMonthItem(bgt))
-        self.sign = self.expenses_table.itemChanged  # type: ignore[attr-defined]
-        self.sign.connect(self.edit_bgt_event)
-
         layout.addWidget(self.expenses_table)
         self.setLayout(layout)
 
         self.presenter = BudgetPresenter(self, RepositoryFactory())
 
-        expenses = self.exp_getter()
-        bgt = self.bgt_getter()
+        QtCore.QTimer.singleShot(0, self._initial_load)
 
-        self.update_expenses(expenses)
-        self.update_budget(bgt)
+    def _initial_load(self) -> None:
+        """Fills table with data from presenter after widget is shown.
+        """
+        self.update_expenses(self.exp_getter())
+        self.update_budget(self.bgt_getter())
 
     def register_bgt_getter(self, handler: Callable[[], Budget]) -> None:
         """Registers bgt_getter.
@@ -187,20 +190,13 @@ class BudgetWidget(QWidget):
         """
         self.exp_getter = handler
 
-    def edit_bgt_event(self, bgt_item: AbstractItem) -> None:
+    def edit_bgt_event(self, bgt: Budget) -> None:
         """Event to process editing budget.
 
         Args:
-            bgt_item (AbstractItem): Budget to edit.
+            bgt (Budget): Edited budget.
         """
-        value = bgt_item.get_value()
-        if value is None:
-            QMessageBox.critical(self, 'Ошибка', 'Используйте только числа.')
-        else:
-            bgt_item.get().amount = value
-            self.bgt_modifier(bgt_item.get())
-
-        self.update_budget(bgt_item.get())
+        self.bgt_modifier(bgt)
 
     def update_expenses(self, exps: list[float]) -> None:
         """Updates table records responsible for expenses.
@@ -208,11 +204,9 @@ class BudgetWidget(QWidget):
         Args:
             exps (list[float]): expenses to set.
         """
-        self.sign.disconnect()
-        assert len(exps) == 3
-        for i, exp in enumerate(exps):
-            self.expenses_table.item(i, 0).setText(str(round(exp, 2)))
-        self.sign.connect(self.edit_bgt_event)
+        # column width is recomputed only when the longest text changes
+        if self.model.set_expenses(exps):
+            self.expenses_table.resizeColumnToContents(0)
 
     def update_budget(self, bgt: Budget) -> None:
         """Updates table records responsible for budget.
@@ -220,12 +214,7 @@ class BudgetWidget(QWidget):
         Args:
             bgt (Budget): budget to set.
         """
-        self.sign.disconnect()
-        for i in range(3):
-            bitem = self.expenses_table.item(i, 1)
-            assert isinstance(bitem, (LimitDayItem, LimitMonthItem, LimitWeekItem))
-            bitem.update(bgt)
-        self.sign.connect(self.edit_bgt_event)
+        self.model.set_budget(bgt)
 
     def retrieve_exp(self) -> None:
         """Gets expenses from ExpensesWidget and updates expenses.
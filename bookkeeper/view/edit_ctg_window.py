@@ -67,8 +67,8 @@ class EditCtgWindow(QWidget):
         add_a.triggered.connect(self.add_ctg_event)  # type: ignore[attr-defined]
         del_a = self.menu.addAction('Удалить')
         del_a.triggered.connect(self.delete_ctg_event)  # type: ignore[attr-defined]
-        self.sign = self.ctgs_widget.itemChanged   # type: ignore[attr-defined]
-        self.sign.connect(self.edit_ctg_event)
+        self.ctgs_widget.itemChanged.connect(  # type: ignore[attr-defined]
+            self.edit_ctg_event)
 
     def get_selected_ctg(self) -> QTreeWidgetItem:
         """Returns selected QTreeWidgetItem.
@@ -177,9 +177,8 @@ class EditCtgWindow(QWidget):
             revert = self.rename_ctg
 
         if not self.ctg_checker(entered_text):
-            self.sign.disconnect()
-            revert(ctg_item, column)
-            self.sign.connect(self.edit_ctg_event)
+            with QtCore.QSignalBlocker(self.ctgs_widget):
+                revert(ctg_item, column)
             QMessageBox.critical(self, 'Ошибка',
                                  f'Category {entered_text} already exists')
         else:
@@ -204,9 +203,8 @@ class EditCtgWindow(QWidget):
                                  'Создание подкатегории категории с ошибкой.')
             return
 
-        self.sign.disconnect()
-        new_ctg = CategoryItem(parent_item, Category(parent=parent_pk))
-        self.sign.connect(self.edit_ctg_event)
+        with QtCore.QSignalBlocker(self.ctgs_widget):
+            new_ctg = CategoryItem(parent_item, Category(parent=parent_pk))
         self.ctgs_widget.setCurrentItem(new_ctg)
         self.ctgs_widget.edit(self.ctgs_widget.currentIndex())
 
@@ -214,8 +214,7 @@ class Table(QTableWidget):
         del_a = self.menu.addAction('Удалить')
         del_a.triggered.connect(self.delete_exp_event)  # type: ignore[attr-defined]
 
-        self.sign = self.itemChanged  # type: ignore[attr-defined]
-        self.sign.connect(self.update_exp_event)
+        self.itemChanged.connect(self.update_exp_event)  # type: ignore[attr-defined]
 
     def update_exp_event(self, exp_item: TableItem) -> None:
         """Logic when item is changed.
@@ -224,17 +223,15 @@ class Table(QTableWidget):
             exp_item (TableItem): Item to update.
         """
         if not exp_item.validate():
-            self.sign.disconnect()
-            QMessageBox.critical(self, 'Ошибка', exp_item.get_err_msg())
-            exp_item.restore()
-            self.sign.connect(self.update_exp_event)
+            with QtCore.QSignalBlocker(self):
+                QMessageBox.critical(self, 'Ошибка', exp_item.get_err_msg())
+                exp_item.restore()
             return
 
         exp_item.update()
         if isinstance(exp_item, TableAmountItem):
-            self.sign.disconnect()
-            exp_item.restore()
-            self.sign.connect(self.update_exp_event)
+            with QtCore.QSignalBlocker(self):
+                exp_item.restore()
 
         if exp_item.should_emit_on_upd():
             self.wparent.emit_exp_changed()
@@ -251,12 +248,11 @@ class Table(QTableWidget):
         ctg_item = TableCategoryItem(row, self.wparent)
         rcount = self.rowCount()
         self.setRowCount(rcount+1)
-        self.sign.disconnect()
-        self.setItem(rcount, 0, TableDateItem(row))
-        self.setItem(rcount, 1, TableAmountItem(row))
-        self.setItem(rcount, 2, ctg_item)
-        self.setItem(rcount, 3, TableItem(row))
-        self.sign.connect(self.update_exp_event)
+        with QtCore.QSignalBlocker(self):
+            self.setItem(rcount, 0, TableDateItem(row))
+            self.setItem(rcount, 1, TableAmountItem(row))
+            self.setItem(rcount, 2, ctg_item)
+            self.setItem(rcount, 3, TableItem(row))
 
     def delete_exp_event(self) -> None:
         """Deletes expense row.
@@ -0,0 +1,32 @@
+import pytest
+
+from bookkeeper.repository.memory_repository import MemoryRepository
+from bookkeeper.models.budget import Budget
+
+
+@pytest.fixture
+def repo():
+    return MemoryRepository()
+
+
+def test_create_with_full_args_list():
+    b = Budget(amount=100.0, pk=1)
+    assert b.amount == 100.0
+    assert b.pk == 1
+
+
+def test_create_brief():
+    b = Budget(100.0)
+    assert b.amount == 100.0
+    assert b.pk == 0
+
+
+def test_has_no_instance_dict():
+    with pytest.raises(AttributeError):
+        Budget().other = 1
+
+
+def test_can_add_to_repo(repo):
+    b = Budget(100.0)
+    pk = repo.add(b)
+    assert b.pk == pk
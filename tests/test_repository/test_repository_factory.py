@@ -0,0 +1,94 @@
+from bookkeeper.repository import repository_factory
+from bookkeeper.repository.repository_factory import _ConnectionPool, RepositoryFactory
+from bookkeeper.repository.sqlite_repository import SQLiteRepository
+
+from pathlib import Path
+import os
+import pytest
+import sqlite3
+import subprocess
+import sys
+
+
+@pytest.fixture
+def custom_class():
+    class Custom():
+        pk: int = 0
+        name: str = "TEST"
+
+    return Custom
+
+
+@pytest.fixture
+def pool(tmp_path):
+    return _ConnectionPool(str(tmp_path / "pool.db"))
+
+
+def test_pool_reuses_connection(pool):
+    with pool.acquire() as con:
+        first = con
+    with pool.acquire() as con:
+        assert con is first
+
+
+def test_pool_opens_new_connection_if_busy(pool):
+    with pool.acquire() as con1:
+        with pool.acquire() as con2:
+            assert con1 is not con2
+
+
+def test_pool_instance_per_file(tmp_path):
+    path = str(tmp_path / "pool.db")
+    assert _ConnectionPool.get_instance(path) is _ConnectionPool.get_instance(path)
+
+
+def test_repository_with_pool(pool, custom_class):
+    repo = SQLiteRepository(pool.db_file, custom_class, pool.acquire)
+    obj = custom_class()
+    pk = repo.add(obj)
+    assert repo.get(pk).name == obj.name
+    repo.delete(pk)
+    assert repo.get(pk) is None
+
+
+def test_repository_with_pool_add_many_failure(pool, custom_class):
+    repo = SQLiteRepository(pool.db_file, custom_class, pool.acquire)
+    objects = [custom_class() for i in range(3)]
+    objects[1].name = object()
+    with pytest.raises(sqlite3.Error):
+        repo.add_many(objects)
+    assert [o.pk for o in objects] == [0, 0, 0]
+    assert repo.get_all() == []
+
+
+def test_pool_connection_pragmas(pool):
+    with pool.acquire() as con:
+        assert con.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+        assert con.execute('PRAGMA mmap_size').fetchone()[0] == 268435456
+
+
+@pytest.fixture
+def factory(monkeypatch, tmp_path):
+    monkeypatch.setattr(repository_factory, '_DB_PATH', str(tmp_path / "factory.db"))
+    return RepositoryFactory()
+
+
+def test_factory_reuses_repositories(factory):
+    assert factory.get_ctg() is factory.get_ctg()
+    assert factory.get_bgt() is factory.get_bgt()
+    assert factory.get_exp() is factory.get_exp()
+
+
+def test_factory_uses_db_path(factory):
+    assert factory.get_ctg().db_file == repository_factory._DB_PATH
+
+
+def test_db_path_from_env(tmp_path):
+    path = str(tmp_path / "env.db")
+    env = dict(os.environ, BOOKKEEPER_DB=path)
+    code = ('from bookkeeper.repository.repository_factory import _DB_PATH; '
+            'print(_DB_PATH)')
+    result = subprocess.run([sys.executable, '-c', code], env=env,
+                            cwd=Path(__file__).parents[2],
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == path
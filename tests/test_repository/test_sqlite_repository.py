@@ -1,10 +1,12 @@
 from bookkeeper.repository.sqlite_repository import SQLiteRepository
+from bookkeeper.models.budget import Budget
 
 import pytest
+import sqlite3
 from datetime import datetime
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def custom_class():
     class Custom():
         pk: int = 0
@@ -22,9 +24,15 @@ def custom_class():
     return Custom
 
 
-@pytest.fixture
-def repo(custom_class):
-    return SQLiteRepository("databases/test_database.db", custom_class)
+@pytest.fixture(scope="module")
+def repo(custom_class, tmp_path_factory):
+    db_file = tmp_path_factory.mktemp("db") / "test_database.db"
+    return SQLiteRepository(str(db_file), custom_class)
+
+
+@pytest.fixture(autouse=True)
+def clean_repo(repo):
+    repo.delete_all()
 
 
 def test_crud(repo, custom_class):
@@ -72,22 +80,59 @@ def test_cannot_update_without_pk(repo, custom_class):
 
 
 def test_get_all(repo, custom_class):
-    repo.delete_all()
     objects = [custom_class() for i in range(5)]
-    for o in objects:
-        repo.add(o)
+    repo.add_many(objects)
     assert repo.get_all() == objects
 
 
 def test_get_all_with_condition(repo, custom_class):
-    repo.delete_all()
     objects = []
     for i in range(5):
         o = custom_class()
         o.name = 'test'
         o.value = i
-        repo.add(o)
         objects.append(o)
+    repo.add_many(objects)
 
     assert repo.get_all({'value': 0}) == [objects[0]]
     assert repo.get_all({'name': 'test'}) == objects
+
+
+def test_add_many(repo, custom_class):
+    objects = [custom_class() for i in range(3)]
+    pks = repo.add_many(objects)
+    assert pks == [o.pk for o in objects]
+    assert [repo.get(pk) for pk in pks] == objects
+
+
+def test_cannot_add_many_with_pk(repo, custom_class):
+    objects = [custom_class() for i in range(3)]
+    objects[1].pk = 1
+    with pytest.raises(ValueError):
+        repo.add_many(objects)
+
+
+def test_add_many_failure_keeps_pks(repo, custom_class):
+    objects = [custom_class() for i in range(3)]
+    objects[1].name = object()
+    with pytest.raises(sqlite3.Error):
+        repo.add_many(objects)
+    assert [o.pk for o in objects] == [0, 0, 0]
+    assert repo.get_all() == []
+
+    objects[1].name = "TEST"
+    repo.add_many(objects)
+    assert repo.get_all() == objects
+
+
+def test_slotted_dataclass(tmp_path):
+    bgt_repo = SQLiteRepository(str(tmp_path / "budget.db"), Budget)
+    pk = bgt_repo.add(Budget(12.5))
+    assert bgt_repo.get(pk) == Budget(12.5, pk)
+
+
+def test_sql_is_shared_and_read_only(repo, custom_class):
+    other = SQLiteRepository(repo.db_file, custom_class)
+    assert other.sql is repo.sql
+    with pytest.raises(TypeError):
+        repo.sql['select'] = ''
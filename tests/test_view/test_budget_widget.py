@@ -0,0 +1,77 @@
+import pytest
+
+pytest.importorskip("PySide6")
+
+from PySide6 import QtCore
+
+from bookkeeper.view.budget_widget import BudgetTableModel
+from bookkeeper.models.budget import Budget
+
+DISPLAY_ROLE = QtCore.Qt.ItemDataRole.DisplayRole
+EDIT_ROLE = QtCore.Qt.ItemDataRole.EditRole
+EDITABLE = QtCore.Qt.ItemFlag.ItemIsEditable
+
+
+@pytest.fixture
+def modified():
+    return []
+
+
+@pytest.fixture
+def model(modified):
+    return BudgetTableModel(modified.append)
+
+
+def test_empty_before_load(model, modified):
+    for row in range(3):
+        for col in range(2):
+            assert model.data(model.index(row, col), DISPLAY_ROLE) is None
+    assert model.data(model.index(0, 1), EDIT_ROLE) is None
+    assert not model.flags(model.index(0, 1)) & EDITABLE
+    assert not model.setData(model.index(0, 1), 1.0, EDIT_ROLE)
+    assert modified == []
+
+
+def test_filled_after_load(model):
+    model.set_expenses([1.0, 2.0, 3.0])
+    model.set_budget(Budget(1.5, pk=1))
+    assert model.data(model.index(2, 0), DISPLAY_ROLE) == '3.00'
+    assert model.data(model.index(1, 1), DISPLAY_ROLE) == '10.50'
+    assert model.flags(model.index(0, 1)) & EDITABLE
+    assert not model.flags(model.index(0, 0)) & EDITABLE
+
+
+def test_edit_role_is_float_for_int_amount(model):
+    model.set_budget(Budget(0, pk=1))
+    for row in range(3):
+        value = model.data(model.index(row, 1), EDIT_ROLE)
+        assert isinstance(value, float)
+        assert value == 0.0
+
+
+def test_set_data_converts_to_daily_amount(model, modified):
+    bgt = Budget(0, pk=1)
+    model.set_budget(bgt)
+    assert model.setData(model.index(1, 1), 70.0, EDIT_ROLE)
+    assert bgt.amount == 10.0
+    assert modified == [bgt]
+
+
+def test_set_data_rejects_non_number(model, modified):
+    model.set_budget(Budget(1.0, pk=1))
+    assert not model.setData(model.index(0, 1), 'abc', EDIT_ROLE)
+    assert modified == []
+
+
+def test_negative_zero_is_shown_as_zero(model):
+    model.set_budget(Budget(1.0, pk=1))
+    assert model.setData(model.index(0, 1), -0.0, EDIT_ROLE)
+    model.set_expenses([0, 0.0, 0.0])
+    assert model.bgt_texts == ('0.00', '0.00', '0.00')
+    assert model.exp_texts == ('0.00', '0.00', '0.00')
+
+
+def test_set_expenses_reports_text_length_change(model):
+    assert model.set_expenses([1.0, 2.0, 3.0])
+    assert not model.set_expenses([4.0, 5.0, 6.0])
+    assert model.set_expenses([4.0, 5.0, 60.0])